@@ -1,12 +1,36 @@
 from __future__ import annotations
 
-import csv
+import atexit
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from typing import Optional, TextIO
 
 LOG_PATH = Path("data/logs.csv")
 
+LOG_HEADER = "timestamp_uk,job,status,message,extra\n"
+
+# Kept open for the life of the process; opened lazily on the first log_event
+_LOG_FILE: Optional[TextIO] = None
+
+# Last formatted timestamp, reused for log lines within the same second
+_TS_SEC = 0
+_TS_STR = ""
+
+
+def _open_log() -> TextIO:
+    global _LOG_FILE
+    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    f = LOG_PATH.open("a", buffering=1 << 16, newline="", encoding="utf-8")
+    if f.tell() == 0:
+        f.write(LOG_HEADER)
+    atexit.register(f.close)
+    _LOG_FILE = f
+    return f
+
+
+def _quote(s: str) -> str:
+    return s.replace('"', '""')
+
 
 def log_event(job: str, status: str, message: str = "", extra: str = "") -> None:
     """
@@ -17,19 +41,17 @@ def log_event(job: str, status: str, message: str = "", extra: str = "") -> None
 
     status examples: STARTED, SENT, ERROR
     """
-    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-
-    row = {
-        "timestamp_uk": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "job": job,
-        "status": status,
-        "message": (message or "")[:400],  # avoid huge logs
-        "extra": (extra or "")[:400],
-    }
-
-    file_exists = LOG_PATH.exists()
-    with LOG_PATH.open("a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["timestamp_uk", "job", "status", "message", "extra"])
-        if not file_exists:
-            writer.writeheader()
-        writer.writerow(row)
+    global _TS_SEC, _TS_STR
+    f = _LOG_FILE or _open_log()
+
+    t = int(time.time())
+    if t != _TS_SEC:
+        _TS_STR = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+        _TS_SEC = t
+    ts = _TS_STR
+    msg = _quote((message or "")[:400])  # avoid huge logs
+    ext = _quote((extra or "")[:400])
+
+    f.write(f'{ts},{job},{status},"{msg}","{ext}"\n')
+    # Flush so logs.csv stays readable while the scheduler is running
+    f.flush()
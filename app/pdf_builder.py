@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import io
+import os
+import tempfile
 from pathlib import Path
 from datetime import date
 
@@ -12,21 +15,69 @@ from reportlab.lib.units import cm
 from .plan_reader import CarePlan
 
 
+# Built once at import: styles and text only. Flowables are created per call.
+_STYLES = getSampleStyleSheet()
+if "Title2" not in _STYLES:
+    _STYLES.add(ParagraphStyle(name="Title2", parent=_STYLES["Title"], fontSize=20, leading=24, spaceAfter=12))
+    _STYLES.add(ParagraphStyle(name="H2", parent=_STYLES["Heading2"], spaceBefore=10, spaceAfter=6))
+    _STYLES.add(ParagraphStyle(name="Body", parent=_STYLES["BodyText"], fontSize=10.5, leading=14))
+
+_INCOME_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#111827")),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, 0), 10),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#D1D5DB")),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F9FAFB")]),
+    ("PADDING", (0, 0), (-1, -1), 6),
+])
+
+_BUDGET_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#0F766E")),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, 0), 10),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#D1D5DB")),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -2), [colors.white, colors.HexColor("#F9FAFB")]),
+    ("BACKGROUND", (0, -1), (-1, -1), colors.HexColor("#111827")),
+    ("TEXTCOLOR", (0, -1), (-1, -1), colors.white),
+    ("FONTNAME", (0, -1), (-1, -1), "Helvetica-Bold"),
+    ("PADDING", (0, 0), (-1, -1), 6),
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+])
+
+CHECKLIST = [
+    "Set a fixed transfer date each month and keep it consistent.",
+    "Enroll her in a state health insurance scheme / NHIS equivalent (state-dependent).",
+    "Name one trusted local contact for check-ins and emergencies.",
+    "Build an emergency fund gradually (start with NGN 100k–200k).",
+    "Weekly call rhythm: 1–2 calls per week to support emotional wellbeing after retirement.",
+]
+
+_SUMMARY_TEXT = (
+    "This plan supports your mum after retirement in Nigeria with stability, health coverage, and emergency readiness — "
+    "without over-stretching your finances."
+)
+
+
 def build_mom_care_pdf(
     plan: CarePlan,
     out_path: str | Path,
     fx_rate_note: str = "NGN values are plan estimates (rate may change).",
-) -> Path:
+) -> tuple[Path, bytes]:
+    """
+    Renders the plan PDF in memory, writes it to out_path atomically (temp file +
+    os.replace, so a crash never leaves a truncated PDF behind) and returns
+    (out_path, pdf_bytes) so callers can send the bytes directly.
+    """
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(name="Title2", parent=styles["Title"], fontSize=20, leading=24, spaceAfter=12))
-    styles.add(ParagraphStyle(name="H2", parent=styles["Heading2"], spaceBefore=10, spaceAfter=6))
-    styles.add(ParagraphStyle(name="Body", parent=styles["BodyText"], fontSize=10.5, leading=14))
+    styles = _STYLES
 
+    buf = io.BytesIO()
     doc = SimpleDocTemplate(
-        str(out_path),
+        buf,
         pagesize=A4,
         rightMargin=2 * cm,
         leftMargin=2 * cm,
@@ -34,17 +85,15 @@ def build_mom_care_pdf(
         bottomMargin=2 * cm,
     )
 
+    # Flowables are built fresh on every call: ReportLab keeps layout state (e.g. _postponed)
+    # on each flowable, so sharing them across doc.build calls can raise LayoutError.
     story = []
     story.append(Paragraph("Mom Care Plan 2026", styles["Title2"]))
     story.append(Paragraph(f"Prepared for: Emmanuel Ayoola  |  Date: {date.today().strftime('%d %b %Y')}", styles["Body"]))
     story.append(Spacer(1, 10))
 
     story.append(Paragraph("Plan summary", styles["H2"]))
-    story.append(Paragraph(
-        "This plan supports your mum after retirement in Nigeria with stability, health coverage, and emergency readiness — "
-        "without over-stretching your finances.",
-        styles["Body"]
-    ))
+    story.append(Paragraph(_SUMMARY_TEXT, styles["Body"]))
     story.append(Spacer(1, 8))
 
     story.append(Paragraph("Your income baseline", styles["H2"]))
@@ -57,15 +106,7 @@ def build_mom_care_pdf(
         ],
         colWidths=[7.5 * cm, 7.5 * cm],
     )
-    income_tbl.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#111827")),
-        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-        ("FONTSIZE", (0, 0), (-1, 0), 10),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#D1D5DB")),
-        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F9FAFB")]),
-        ("PADDING", (0, 0), (-1, -1), 6),
-    ]))
+    income_tbl.setStyle(_INCOME_TABLE_STYLE)
     story.append(income_tbl)
     story.append(Spacer(1, 10))
 
@@ -84,37 +125,18 @@ def build_mom_care_pdf(
 
     budget_data = [["Category", "GBP / month", "NGN approx", "Notes"]]
     for item in plan.items:
-        ngn = f"NGN {item.amount_ngn:,.0f}" if item.amount_ngn is not None else "-"
-        budget_data.append([item.category, f"GBP {item.amount_gbp:.0f}", ngn, item.notes or ""])
+        ngn = f"NGN {item.ngn_str}" if item.amount_ngn is not None else "-"
+        budget_data.append([item.category, f"GBP {item.gbp_str}", ngn, item.notes or ""])
     total_ngn = f"NGN {plan.total_support_ngn:,.0f}" if plan.total_support_ngn is not None else "-"
     budget_data.append(["TOTAL", f"GBP {plan.total_support_gbp:.0f}", total_ngn, "Safe & sustainable baseline"])
 
     budget_tbl = Table(budget_data, colWidths=[7.1 * cm, 3.0 * cm, 3.2 * cm, 4.2 * cm])
-    budget_tbl.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#0F766E")),
-        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-        ("FONTSIZE", (0, 0), (-1, 0), 10),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#D1D5DB")),
-        ("ROWBACKGROUNDS", (0, 1), (-1, -2), [colors.white, colors.HexColor("#F9FAFB")]),
-        ("BACKGROUND", (0, -1), (-1, -1), colors.HexColor("#111827")),
-        ("TEXTCOLOR", (0, -1), (-1, -1), colors.white),
-        ("FONTNAME", (0, -1), (-1, -1), "Helvetica-Bold"),
-        ("PADDING", (0, 0), (-1, -1), 6),
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-    ]))
+    budget_tbl.setStyle(_BUDGET_TABLE_STYLE)
     story.append(budget_tbl)
     story.append(Spacer(1, 12))
 
     story.append(Paragraph("Operational checklist (Nigeria)", styles["H2"]))
-    checklist = [
-        "Set a fixed transfer date each month and keep it consistent.",
-        "Enroll her in a state health insurance scheme / NHIS equivalent (state-dependent).",
-        "Name one trusted local contact for check-ins and emergencies.",
-        "Build an emergency fund gradually (start with NGN 100k–200k).",
-        "Weekly call rhythm: 1–2 calls per week to support emotional wellbeing after retirement.",
-    ]
-    for item in checklist:
+    for item in CHECKLIST:
         story.append(Paragraph(f"• {item}", styles["Body"]))
 
     story.append(Spacer(1, 10))
@@ -130,4 +152,18 @@ def build_mom_care_pdf(
         canvas.restoreState()
 
     doc.build(story, onFirstPage=footer, onLaterPages=footer)
-    return out_path
+    data = buf.getvalue()
+    fd, tmp_name = tempfile.mkstemp(dir=out_path.parent, prefix=f".{out_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, out_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    return out_path, data
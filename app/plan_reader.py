@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
-from openpyxl import load_workbook
+from .xlsx_fast import read_sheet_rows
 
 
 @dataclass
@@ -13,6 +13,13 @@ class BudgetItem:
     amount_gbp: float
     amount_ngn: Optional[float] = None
     notes: str = ""
+    # Display strings, formatted once and shared by the PDF and Telegram output
+    gbp_str: str = field(init=False, default="")
+    ngn_str: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        self.gbp_str = f"{self.amount_gbp:.0f}"
+        self.ngn_str = f"{self.amount_ngn:,.0f}" if self.amount_ngn is not None else ""
 
 
 @dataclass
@@ -24,15 +31,18 @@ class CarePlan:
     items: List[BudgetItem]
 
 
+# Single-character symbols stripped in one C-level pass; multi-char codes use replace
+_GBP_STRIP = str.maketrans("", "", "£₦,")
+_NGN_STRIP = str.maketrans("", "", "₦,")
+
+
 def _to_float(v) -> Optional[float]:
-    if v is None:
+    if v is None or v == "":
         return None
     if isinstance(v, (int, float)):
         return float(v)
-    s = str(v).strip().replace(",", "")
     # Handle strings like "£200"
-    for ch in ["£", "GBP", "NGN", "₦"]:
-        s = s.replace(ch, "").strip()
+    s = str(v).translate(_GBP_STRIP).replace("GBP", "").replace("NGN", "").strip()
     if not s:
         return None
     try:
@@ -42,13 +52,12 @@ def _to_float(v) -> Optional[float]:
 
 
 def _to_ngn_float(v) -> Optional[float]:
-    if v is None:
+    if v is None or v == "":
         return None
     if isinstance(v, (int, float)):
         return float(v)
-    s = str(v).strip().replace(",", "")
     # Handle strings like "₦216,000" or "NGN 216,000"
-    s = s.replace("₦", "").replace("NGN", "").strip()
+    s = str(v).translate(_NGN_STRIP).replace("NGN", "").strip()
     if not s:
         return None
     try:
@@ -57,6 +66,18 @@ def _to_ngn_float(v) -> Optional[float]:
         return None
 
 
+# Budget items are under the header "MONTHLY SUPPORT BREAKDOWN"
+_BREAKDOWN_HEADER = "MONTHLY SUPPORT BREAKDOWN"
+_END_LABELS = frozenset({"TOTAL MONTHLY SUPPORT", "REMAINING FOR YOU"})
+
+
+def _find_label(labels: List[str], label: str, start: int = 0) -> Optional[int]:
+    try:
+        return labels.index(label, start)
+    except ValueError:
+        return None
+
+
 def read_care_plan_from_excel(xlsx_path: str | Path) -> CarePlan:
     """
     Reads the 'Mom Monthly Support Plan' sheet created earlier.
@@ -70,88 +91,57 @@ def read_care_plan_from_excel(xlsx_path: str | Path) -> CarePlan:
     if not xlsx_path.exists():
         raise FileNotFoundError(f"Excel file not found: {xlsx_path}")
 
-    wb = load_workbook(xlsx_path, data_only=True)
-    sheet_name = "Mom Monthly Support Plan"
-    if sheet_name not in wb.sheetnames:
-        raise ValueError(f"Sheet '{sheet_name}' not found. Found: {wb.sheetnames}")
-
-    ws = wb[sheet_name]
-
-    # Helper: find row by label in col A
-    def find_row(label: str) -> Optional[int]:
-        label_low = label.strip().lower()
-        for r in range(1, ws.max_row + 1):
-            a = ws.cell(row=r, column=1).value
-            if a is None:
-                continue
-            if str(a).strip().lower() == label_low:
-                return r
-        return None
-
-    # Income rows
-    weekly_row = find_row("Weekly Income")
-    monthly_row = find_row("Monthly Income")
-
-    if weekly_row is None or monthly_row is None:
-        raise ValueError("Could not find 'Weekly Income' and/or 'Monthly Income' rows in column A.")
-
-    weekly_income = _to_float(ws.cell(row=weekly_row, column=2).value) or 0.0
-    monthly_income = _to_float(ws.cell(row=monthly_row, column=2).value) or 0.0
-
-    # Budget items are under the header "MONTHLY SUPPORT BREAKDOWN"
-    header_row = find_row("MONTHLY SUPPORT BREAKDOWN")
-    if header_row is None:
-        raise ValueError("Could not find 'MONTHLY SUPPORT BREAKDOWN' header row.")
+    # Columns A-D of the sheet, one tuple per row (cached values for formulas)
+    rows = read_sheet_rows(xlsx_path, "Mom Monthly Support Plan", max_col=4)
 
     items: List[BudgetItem] = []
     total_support_gbp: float = 0.0
     total_support_ngn: Optional[float] = None
 
-    # Read rows after the header until we hit TOTAL MONTHLY SUPPORT (or blank block ends)
-    r = header_row + 1
-    while r <= ws.max_row:
-        cat = ws.cell(row=r, column=1).value
-        gbp = ws.cell(row=r, column=2).value
-        ngn = ws.cell(row=r, column=3).value
-        note = ws.cell(row=r, column=4).value
+    # Column A, normalised once, to locate the label rows
+    labels = [str(row[0]).strip().upper() if row[0] is not None else "" for row in rows]
 
-        if cat is None:
-            r += 1
-            continue
+    weekly_idx = _find_label(labels, "WEEKLY INCOME")
+    monthly_idx = _find_label(labels, "MONTHLY INCOME")
+    if weekly_idx is None or monthly_idx is None:
+        raise ValueError("Could not find 'Weekly Income' and/or 'Monthly Income' rows in column A.")
 
-        cat_str = str(cat).strip()
-        if not cat_str:
-            r += 1
-            continue
+    header_idx = _find_label(labels, _BREAKDOWN_HEADER)
+    if header_idx is None:
+        raise ValueError("Could not find 'MONTHLY SUPPORT BREAKDOWN' header row.")
+
+    # Read rows after the header until we hit TOTAL MONTHLY SUPPORT (or the sheet ends)
+    end_idx = next(
+        (i for i in range(header_idx + 1, len(labels)) if labels[i] in _END_LABELS),
+        None,
+    )
+
+    weekly_income = _to_float(rows[weekly_idx][1]) or 0.0
+    monthly_income = _to_float(rows[monthly_idx][1]) or 0.0
 
-        # Stop when we reach totals
-        if cat_str.upper() in {"TOTAL MONTHLY SUPPORT", "REMAINING FOR YOU"}:
-            if cat_str.upper() == "TOTAL MONTHLY SUPPORT":
-                total_support_gbp = _to_float(gbp) or 0.0
-                total_support_ngn = _to_ngn_float(ngn)
-            break
+    if end_idx is not None and labels[end_idx] == "TOTAL MONTHLY SUPPORT":
+        total_support_gbp = _to_float(rows[end_idx][1]) or 0.0
+        total_support_ngn = _to_ngn_float(rows[end_idx][2])
 
-        # Skip empty separators
-        if cat_str == "":
-            r += 1
+    item_end = end_idx if end_idx is not None else len(rows)
+    for idx in range(header_idx + 1, item_end):
+        if not labels[idx] or idx in (weekly_idx, monthly_idx):
             continue
 
+        cat, gbp, ngn, note = rows[idx]
         amount_gbp = _to_float(gbp)
         # If we are in breakdown region but row has no GBP, skip
         if amount_gbp is None:
-            r += 1
             continue
 
-        amount_ngn = _to_ngn_float(ngn)
         items.append(
             BudgetItem(
-                category=cat_str,
+                category=str(cat).strip(),
                 amount_gbp=amount_gbp,
-                amount_ngn=amount_ngn,
+                amount_ngn=_to_ngn_float(ngn),
                 notes=str(note).strip() if note else "",
             )
         )
-        r += 1
 
     # If totals weren't found, compute from items
     if total_support_gbp == 0.0 and items:
@@ -182,9 +172,9 @@ def format_plan_for_telegram(plan: CarePlan) -> str:
     lines.append("Breakdown:")
     for item in plan.items:
         if item.amount_ngn is not None:
-            lines.append(f"• {item.category}: £{item.amount_gbp:.0f} (≈ ₦{item.amount_ngn:,.0f})")
+            lines.append(f"• {item.category}: £{item.gbp_str} (≈ ₦{item.ngn_str})")
         else:
-            lines.append(f"• {item.category}: £{item.amount_gbp:.0f}")
+            lines.append(f"• {item.category}: £{item.gbp_str}")
     lines.append("")
     lines.append("✅ Reminder: keep it consistent + save emergency fund monthly.")
     return "\n".join(lines)
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from datetime import datetime
+import dataclasses
+import hashlib
+import os
+import signal
+import threading
+from datetime import date, datetime
 from pathlib import Path
 
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-from .telegram import send_telegram, send_document
-from .plan_reader import read_care_plan_from_excel, format_plan_for_telegram
+from .telegram import send_telegram, send_document, send_document_bytes
+from .plan_reader import CarePlan, read_care_plan_from_excel, format_plan_for_telegram
 from .pdf_builder import build_mom_care_pdf
 from .logger import log_event
 
@@ -19,7 +24,24 @@ MONTHLY_TRANSFER_DAY = 1
 TIMEZONE = "Europe/London"
 
 PDF_DIR = Path("out")
-PDF_DIR.mkdir(exist_ok=True)
+
+# (mtime_ns, plan, telegram_text) of the last successful Excel read
+_PLAN_CACHE: tuple[int, CarePlan, str] | None = None
+
+
+def get_plan() -> tuple[CarePlan, str]:
+    """
+    Returns (plan, telegram_text), re-reading the Excel file only when its mtime changes.
+    """
+    global _PLAN_CACHE
+    mtime_ns = os.stat(PLAN_PATH).st_mtime_ns
+    if _PLAN_CACHE is not None and _PLAN_CACHE[0] == mtime_ns:
+        return _PLAN_CACHE[1], _PLAN_CACHE[2]
+
+    plan = read_care_plan_from_excel(PLAN_PATH)
+    telegram_text = format_plan_for_telegram(plan)
+    _PLAN_CACHE = (mtime_ns, plan, telegram_text)
+    return plan, telegram_text
 
 
 def _safe(job: str, step: str, fn, *args, **kwargs):
@@ -47,21 +69,35 @@ def monthly_support_job() -> None:
     job = "monthly_support"
     log_event(job, "STARTED", message="Monthly job triggered")
 
-    plan = _safe(job, "read_excel_plan", read_care_plan_from_excel, PLAN_PATH)
-    if not plan:
+    loaded = _safe(job, "read_excel_plan", get_plan)
+    if not loaded:
         return
+    plan, plan_text = loaded
 
+    # Created on first use so importing the module touches no files
+    PDF_DIR.mkdir(parents=True, exist_ok=True)
     stamp = datetime.now().strftime("%Y-%m")
-    pdf_path = PDF_DIR / f"Mom_Care_Plan_{stamp}.pdf"
-
-    built = _safe(job, "build_pdf", build_mom_care_pdf, plan, pdf_path)
-    if built:
-        _safe(job, "send_pdf_to_telegram", send_document, built, caption=f"📄 Mom Care Plan ({stamp})")
+    # Same plan + same day -> same PDF (it prints today's date), so retries/catch-up runs
+    # reuse the file instead of re-rendering. The PDF is written atomically, so an
+    # existing file is always complete.
+    key_src = repr((dataclasses.asdict(plan), date.today().isoformat()))
+    key = hashlib.blake2b(key_src.encode(), digest_size=8).hexdigest()
+    pdf_path = PDF_DIR / f"Mom_Care_Plan_{stamp}_{key}.pdf"
+
+    if pdf_path.exists():
+        log_event(job, "SKIPPED", message="build_pdf", extra=f"reusing {pdf_path.name}")
+        _safe(job, "send_pdf_to_telegram", send_document, pdf_path, caption=f"📄 Mom Care Plan ({stamp})")
+    else:
+        built = _safe(job, "build_pdf", build_mom_care_pdf, plan, pdf_path)
+        if built:
+            built_path, pdf_bytes = built
+            _safe(job, "send_pdf_to_telegram", send_document_bytes, pdf_bytes, built_path.name,
+                  caption=f"📄 Mom Care Plan ({stamp})")
 
     msg = (
         "📅 Monthly Support Reminder\n"
         "Today is your scheduled transfer date.\n\n"
-        + format_plan_for_telegram(plan)
+        + plan_text
     )
     _safe(job, "send_text_breakdown", send_telegram, msg)
 
@@ -79,18 +115,19 @@ def emergency_savings_job() -> None:
     job = "emergency_savings"
     log_event(job, "STARTED", message="Emergency savings job triggered")
 
-    plan = _safe(job, "read_excel_plan", read_care_plan_from_excel, PLAN_PATH)
-    if not plan:
+    loaded = _safe(job, "read_excel_plan", get_plan)
+    if not loaded:
         _safe(job, "send_generic_emergency_reminder", send_telegram,
               "💰 MomCareBot: Reminder — put emergency savings aside this week.")
         log_event(job, "DONE", message="Emergency savings job completed")
         return
 
+    plan, _ = loaded
     emergency = next((i for i in plan.items if "emergency" in i.category.lower()), None)
     if emergency:
-        line = f"💰 MomCareBot: Emergency savings reminder — £{emergency.amount_gbp:.0f}"
+        line = f"💰 MomCareBot: Emergency savings reminder — £{emergency.gbp_str}"
         if emergency.amount_ngn is not None:
-            line += f" (≈ ₦{emergency.amount_ngn:,.0f})"
+            line += f" (≈ ₦{emergency.ngn_str})"
         _safe(job, "send_emergency_amount_reminder", send_telegram, line)
     else:
         _safe(job, "send_generic_emergency_reminder", send_telegram,
@@ -100,14 +137,17 @@ def emergency_savings_job() -> None:
 
 
 def start_scheduler() -> None:
-    sched = BlockingScheduler(timezone=TIMEZONE)
+    # coalesce + max_instances: at most one run per slot, even after downtime
+    sched = BackgroundScheduler(
+        timezone=TIMEZONE,
+        job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 3600},
+    )
 
     sched.add_job(
         monthly_support_job,
         CronTrigger(day=MONTHLY_TRANSFER_DAY, hour=9, minute=0),
         id="monthly_support",
         replace_existing=True,
-        misfire_grace_time=3600,
     )
 
     sched.add_job(
@@ -115,7 +155,6 @@ def start_scheduler() -> None:
         CronTrigger(day_of_week="sun", hour=18, minute=0),
         id="weekly_call",
         replace_existing=True,
-        misfire_grace_time=3600,
     )
 
     sched.add_job(
@@ -123,9 +162,20 @@ def start_scheduler() -> None:
         CronTrigger(day_of_week="fri", hour=19, minute=0),
         id="emergency_savings",
         replace_existing=True,
-        misfire_grace_time=3600,
     )
 
     log_event("system", "STARTED", message="Scheduler started")
     _safe("system", "startup_message", send_telegram, "✅ MomCareBot started. Logging + monthly PDF are active.")
     sched.start()
+
+    # Jobs run on the scheduler's worker threads; the main thread just sleeps until a signal
+    stop = threading.Event()
+
+    def _shutdown(signum, frame):
+        log_event("system", "STOPPED", message=f"Received {signal.Signals(signum).name}")
+        sched.shutdown(wait=True)
+        stop.set()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+    stop.wait()
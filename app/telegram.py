@@ -1,20 +1,67 @@
 import os
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:  # orjson is pinned in requirements.txt; fallback for bare local envs
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# One process-wide session so consecutive sends reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        # Only retry when the message was certainly not delivered: connection failures
+        # and 429 (honouring Retry-After). No read retries (read=0) and no 5xx retries,
+        # since Telegram may already have sent the message by then and a retry duplicates it.
+        # POST has to be allowed explicitly or urllib3 never applies status_forcelist.
+        max_retries=Retry(
+            total=2,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=[429],
+            allowed_methods=frozenset({"POST"}),
+        ),
+    ),
+)
+
+# (connect, read) timeouts in seconds
+_TIMEOUT = (5, 30)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_CREDS: tuple[str, str] | None = None
 
 
 def _get_creds():
+    global _CREDS
+    if _CREDS is not None:
+        return _CREDS
     token = os.getenv("TELEGRAM_BOT_TOKEN")
     chat_id = os.getenv("TELEGRAM_CHAT_ID")
     if not token or not chat_id:
         raise RuntimeError("Missing TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID in .env")
-    return token, chat_id
+    _CREDS = (token, chat_id)
+    return _CREDS
 
 
 def send_telegram(message: str) -> None:
     token, chat_id = _get_creds()
     url = f"https://api.telegram.org/bot{token}/sendMessage"
-    r = requests.post(url, json={"chat_id": chat_id, "text": message})
+    body = _dumps({"chat_id": chat_id, "text": message})
+    r = _SESSION.post(url, data=body, headers=_JSON_HEADERS, timeout=_TIMEOUT)
     r.raise_for_status()
 
 
@@ -22,12 +69,23 @@ def send_document(file_path: str | Path, caption: str = "") -> None:
     token, chat_id = _get_creds()
     file_path = Path(file_path)
 
-    if not file_path.exists():
-        raise FileNotFoundError(f"Document not found: {file_path}")
-
     url = f"https://api.telegram.org/bot{token}/sendDocument"
-    with file_path.open("rb") as f:
+    try:
+        f = file_path.open("rb")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Document not found: {file_path}") from e
+
+    with f:
         files = {"document": (file_path.name, f)}
         data = {"chat_id": chat_id, "caption": caption} if caption else {"chat_id": chat_id}
-        r = requests.post(url, data=data, files=files)
+        r = _SESSION.post(url, data=data, files=files, timeout=_TIMEOUT)
         r.raise_for_status()
+
+
+def send_document_bytes(content: bytes, filename: str, caption: str = "") -> None:
+    token, chat_id = _get_creds()
+    url = f"https://api.telegram.org/bot{token}/sendDocument"
+    files = {"document": (filename, content)}
+    data = {"chat_id": chat_id, "caption": caption} if caption else {"chat_id": chat_id}
+    r = _SESSION.post(url, data=data, files=files, timeout=_TIMEOUT)
+    r.raise_for_status()
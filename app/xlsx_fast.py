@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import posixpath
+import re
+import zipfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from xml.etree.ElementTree import iterparse, fromstring
+
+# SpreadsheetML / relationship namespaces
+_NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+
+# Built-in number formats that display dates/times (ECMA-376 18.8.30)
+_BUILTIN_DATE_FMTS = frozenset(range(14, 23)) | frozenset({45, 46, 47})
+
+# Quoted literals, escaped chars and [..] sections (colours, locales) never make a format a date,
+# except elapsed-time markers like [h] / [mm] / [ss]
+_FMT_NOISE = re.compile(r'"[^"]*"|\\.|\[(?![hms]+\])[^\]]*\]', re.IGNORECASE)
+_FMT_DATE_CHARS = re.compile(r"[dmyhs]", re.IGNORECASE)
+
+_EPOCH_1900 = datetime(1899, 12, 30)
+_EPOCH_1904 = datetime(1904, 1, 1)
+
+Row = Tuple[object, ...]
+
+
+def _col_index(letters: str) -> int:
+    """'A' -> 0, 'B' -> 1, ..., 'AA' -> 26"""
+    n = 0
+    for ch in letters:
+        n = n * 26 + (ord(ch) - 64)
+    return n - 1
+
+
+def _sheet_paths(zf: zipfile.ZipFile) -> Tuple[Dict[str, str], bool]:
+    """
+    Maps sheet name -> zip member path using xl/workbook.xml and its rels.
+    Also returns whether the workbook uses the 1904 date system.
+    """
+    rels = fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+    targets = {}
+    for rel in rels.iter(f"{_NS_PKG_REL}Relationship"):
+        target = rel.get("Target", "")
+        # Targets are usually relative to xl/, but may be absolute within the package
+        if target.startswith("/"):
+            target = target.lstrip("/")
+        else:
+            target = posixpath.normpath(posixpath.join("xl", target))
+        targets[rel.get("Id")] = target
+
+    wb = fromstring(zf.read("xl/workbook.xml"))
+    paths = {}
+    for sheet in wb.iter(f"{_NS_MAIN}sheet"):
+        rid = sheet.get(f"{_NS_REL}id")
+        if rid in targets:
+            paths[sheet.get("name")] = targets[rid]
+
+    pr = wb.find(f"{_NS_MAIN}workbookPr")
+    date1904 = pr is not None and pr.get("date1904") in ("1", "true")
+    return paths, date1904
+
+
+def _is_date_format(code: str) -> bool:
+    return bool(_FMT_DATE_CHARS.search(_FMT_NOISE.sub("", code)))
+
+
+def _date_styles(zf: zipfile.ZipFile) -> FrozenSet[int]:
+    """
+    Returns the cellXfs indexes (the cell "s" attribute) whose number format is a date/time.
+    """
+    if "xl/styles.xml" not in zf.namelist():
+        return frozenset()
+
+    styles = fromstring(zf.read("xl/styles.xml"))
+    date_fmts = set(_BUILTIN_DATE_FMTS)
+    num_fmts = styles.find(f"{_NS_MAIN}numFmts")
+    if num_fmts is not None:
+        for fmt in num_fmts.iter(f"{_NS_MAIN}numFmt"):
+            if _is_date_format(fmt.get("formatCode", "")):
+                date_fmts.add(int(fmt.get("numFmtId")))
+
+    cell_xfs = styles.find(f"{_NS_MAIN}cellXfs")
+    if cell_xfs is None:
+        return frozenset()
+    return frozenset(
+        idx for idx, xf in enumerate(cell_xfs.iter(f"{_NS_MAIN}xf"))
+        if int(xf.get("numFmtId", "0")) in date_fmts
+    )
+
+
+def _from_excel(serial: float, date1904: bool) -> datetime:
+    if date1904:
+        return _EPOCH_1904 + timedelta(days=serial)
+    # Serials below 60 predate Excel's phantom 1900-02-29
+    epoch = _EPOCH_1900 if serial >= 60 else _EPOCH_1900 + timedelta(days=1)
+    return epoch + timedelta(days=serial)
+
+
+def _shared_strings(zf: zipfile.ZipFile) -> List[str]:
+    if "xl/sharedStrings.xml" not in zf.namelist():
+        return []
+
+    strings: List[str] = []
+    with zf.open("xl/sharedStrings.xml") as f:
+        for _, el in iterparse(f, events=("end",)):
+            if el.tag == f"{_NS_MAIN}si":
+                # Plain (<si><t>) and rich text (<si><r><t>) runs; phonetic hints (<rPh>) are skipped
+                parts = []
+                for child in el:
+                    if child.tag == f"{_NS_MAIN}t":
+                        parts.append(child.text or "")
+                    elif child.tag == f"{_NS_MAIN}r":
+                        t = child.find(f"{_NS_MAIN}t")
+                        parts.append((t.text or "") if t is not None else "")
+                strings.append("".join(parts))
+                el.clear()
+    return strings
+
+
+def _cell_value(c, sst: List[str], date_styles: FrozenSet[int], date1904: bool):
+    t = c.get("t", "n")
+    if t == "inlineStr":
+        return "".join(x.text or "" for x in c.iter(f"{_NS_MAIN}t"))
+
+    v = c.find(f"{_NS_MAIN}v")
+    if v is None or v.text is None:
+        return None
+    text = v.text
+
+    if t == "s":
+        return sst[int(text)]
+    if t in ("str", "e"):
+        return text
+    if t == "b":
+        return text == "1"
+    if t != "n":
+        # "d" (ISO 8601 date) and any other non-numeric type: keep the raw text
+        return text
+    # Numeric: keep integers as int, like openpyxl does
+    try:
+        value = int(text)
+    except ValueError:
+        value = float(text)
+    # Date-formatted numbers are stored as serials; convert like openpyxl
+    if int(c.get("s", "0")) in date_styles:
+        return _from_excel(value, date1904)
+    return value
+
+
+def read_sheet_rows(xlsx_path: str | Path, sheet_name: str, max_col: int = 4) -> List[Row]:
+    """
+    Streams one worksheet and returns its rows as tuples of the first max_col
+    cell values (cached values for formulas, None for empty cells). Numbers in
+    date-formatted cells come back as datetime, as with openpyxl.
+
+    Row gaps in the sheet are preserved as all-None rows, so list index i is sheet row i + 1.
+    """
+    with zipfile.ZipFile(xlsx_path) as zf:
+        paths, date1904 = _sheet_paths(zf)
+        if sheet_name not in paths:
+            raise ValueError(f"Sheet '{sheet_name}' not found. Found: {list(paths)}")
+
+        sst = _shared_strings(zf)
+        date_styles = _date_styles(zf)
+        empty: Row = (None,) * max_col
+        rows: List[Row] = []
+
+        with zf.open(paths[sheet_name]) as f:
+            for _, el in iterparse(f, events=("end",)):
+                if el.tag != f"{_NS_MAIN}row":
+                    continue
+
+                r = el.get("r")
+                row_num = int(r) if r else len(rows) + 1
+                while len(rows) < row_num - 1:
+                    rows.append(empty)
+
+                values: List[Optional[object]] = [None] * max_col
+                for pos, c in enumerate(el.iter(f"{_NS_MAIN}c")):
+                    ref = c.get("r")
+                    m = _CELL_REF.match(ref) if ref else None
+                    col = _col_index(m.group(1)) if m else pos
+                    if col < max_col:
+                        values[col] = _cell_value(c, sst, date_styles, date1904)
+
+                rows.append(tuple(values))
+                el.clear()
+
+    return rows
@@ -0,0 +1,31 @@
+import pytest
+
+pytest.importorskip("reportlab")
+
+from app.pdf_builder import build_mom_care_pdf
+from app.plan_reader import BudgetItem, CarePlan
+
+
+def _multi_page_plan(n_items: int = 15) -> CarePlan:
+    items = [BudgetItem(f"Item {i}", 10.0 + i, 1000.0 * i, "") for i in range(n_items)]
+    return CarePlan(
+        weekly_income_gbp=500.0,
+        monthly_income_gbp=2166.0,
+        total_support_gbp=sum(i.amount_gbp for i in items),
+        total_support_ngn=sum(i.amount_ngn for i in items),
+        items=items,
+    )
+
+
+@pytest.mark.parametrize("n_items", [12, 15])
+def test_build_twice_in_same_process(tmp_path, n_items):
+    # The scheduler is long-running, so consecutive builds must not share layout state
+    plan = _multi_page_plan(n_items)
+
+    first_path, first_bytes = build_mom_care_pdf(plan, tmp_path / "first.pdf")
+    second_path, second_bytes = build_mom_care_pdf(plan, tmp_path / "second.pdf")
+
+    assert first_bytes.startswith(b"%PDF")
+    assert second_bytes.startswith(b"%PDF")
+    assert first_path.read_bytes() == first_bytes
+    assert second_path.read_bytes() == second_bytes
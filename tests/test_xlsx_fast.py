@@ -0,0 +1,58 @@
+import zipfile
+from datetime import datetime
+
+from app.xlsx_fast import read_sheet_rows
+
+_MAIN = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+_REL = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+
+
+def _write_xlsx(path, sheet_rows: str, date1904: bool = False) -> None:
+    workbook_pr = '<workbookPr date1904="1"/>' if date1904 else ""
+    workbook = (
+        f"<workbook {_MAIN} {_REL}>{workbook_pr}"
+        '<sheets><sheet name="Plan" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    )
+    rels = (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="worksheet" Target="worksheets/sheet1.xml"/></Relationships>'
+    )
+    # xf 0: General, xf 1: built-in date (14), xf 2: custom date, xf 3: custom currency
+    styles = (
+        f"<styleSheet {_MAIN}><numFmts>"
+        '<numFmt numFmtId="164" formatCode="dd/mm/yyyy"/>'
+        '<numFmt numFmtId="165" formatCode="&quot;NGN&quot; #,##0;[Red]-#,##0"/>'
+        "</numFmts><cellXfs>"
+        '<xf numFmtId="0"/><xf numFmtId="14"/><xf numFmtId="164"/><xf numFmtId="165"/>'
+        "</cellXfs></styleSheet>"
+    )
+    sheet = f"<worksheet {_MAIN}><sheetData>{sheet_rows}</sheetData></worksheet>"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("xl/workbook.xml", workbook)
+        zf.writestr("xl/_rels/workbook.xml.rels", rels)
+        zf.writestr("xl/styles.xml", styles)
+        zf.writestr("xl/worksheets/sheet1.xml", sheet)
+
+
+def test_date_formatted_numbers_become_datetimes(tmp_path):
+    path = tmp_path / "plan.xlsx"
+    _write_xlsx(
+        path,
+        '<row r="1">'
+        '<c r="A1"><v>46023</v></c>'
+        '<c r="B1" s="1"><v>46023</v></c>'
+        '<c r="C1" s="2"><v>46023.5</v></c>'
+        '<c r="D1" s="3"><v>216000</v></c>'
+        "</row>",
+    )
+
+    assert read_sheet_rows(path, "Plan") == [
+        (46023, datetime(2026, 1, 1), datetime(2026, 1, 1, 12), 216000),
+    ]
+
+
+def test_date1904_workbook(tmp_path):
+    path = tmp_path / "plan.xlsx"
+    _write_xlsx(path, '<row r="1"><c r="A1" s="1"><v>0</v></c></row>', date1904=True)
+
+    assert read_sheet_rows(path, "Plan") == [(datetime(1904, 1, 1), None, None, None)]